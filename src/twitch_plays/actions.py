@@ -14,5 +14,5 @@ async def PLACEHOLDER_ACTION(command: str) -> None:
     Args:
         command: The winning command to execute
     """
-    logger.info(f"PLACEHOLDER_ACTION: {command}")
+    logger.info("PLACEHOLDER_ACTION: %s", command)
     print(f"🎮 Executing command: {command.upper()}")
@@ -1,5 +1,6 @@
 """Twitch bot implementation for Twitch Plays."""
 import logging
+import re
 from twitchio.ext import commands
 
 from .config import TwitchConfig
@@ -26,9 +27,18 @@ class TwitchPlaysBot(commands.Bot):
         )
         self.config = config
         self.vote_manager = vote_manager
+        # Instance-local copy so the message hot path skips the config hop
+        self._prefix_first_char = config.bot_prefix[0]
+        # One precompiled pattern recognizes every command in a single C-level
+        # match, handling surrounding whitespace and case without string churn
+        self._cmd_re = re.compile(
+            rf"^\s*{re.escape(config.bot_prefix)}\s*({'|'.join(map(re.escape, config.commands))})\b",
+            re.IGNORECASE,
+        )
 
     async def event_ready(self):
         """Called when the bot is ready and connected to Twitch."""
+        self.vote_manager.mark_ready()
         logger.info(f"Logged in as {self.nick}")
         logger.info(f"Connected to channel: {self.config.channel_name}")
         print(f"✅ Bot ready: {self.nick}")
@@ -48,16 +58,18 @@ class TwitchPlaysBot(commands.Bot):
         if message.echo:
             return
 
-        content = message.content.strip()
-
-        # Check if message starts with command prefix
-        if not content.startswith(self.config.bot_prefix):
+        # Cheap prefilter: almost all chatter starts with neither the prefix
+        # nor whitespace that could precede it, and bails out on one compare
+        raw = message.content
+        if not raw or (raw[0] != self._prefix_first_char and not raw[0].isspace()):
             return
 
-        # Extract command (remove prefix and convert to lowercase)
-        command = content[len(self.config.bot_prefix):].strip().lower()
+        match = self._cmd_re.match(raw)
 
-        # Only record vote if it's a valid command
-        if command in self.config.commands:
+        if match:
+            command = match.group(1).lower()
             self.vote_manager.record_vote(command)
-            logger.debug(f"Vote recorded: {command} from {message.author.name}")
+            # Gate the debug log so the author lookup and formatting cost
+            # nothing at the INFO level the bot normally runs at
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Vote recorded: %s from %s", command, message.author.name)
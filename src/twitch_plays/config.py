@@ -1,5 +1,7 @@
 """Configuration management for Twitch Plays bot."""
-from pydantic import Field, field_validator, computed_field
+from functools import cached_property
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,11 +27,10 @@ class TwitchConfig(BaseSettings):
         alias="COMMANDS",
     )
 
-    @computed_field
-    @property
-    def commands(self) -> list[str]:
-        """Parse commands from comma-separated string."""
-        return [cmd.strip().lower() for cmd in self.commands_str.split(",") if cmd.strip()]
+    @cached_property
+    def commands(self) -> tuple[str, ...]:
+        """Parse commands from comma-separated string (parsed once, then cached)."""
+        return tuple(cmd.strip().lower() for cmd in self.commands_str.split(",") if cmd.strip())
 
     # Voting Configuration
     vote_window_seconds: float = Field(
@@ -56,27 +56,21 @@ async def main():
         action_handler=PLACEHOLDER_ACTION,
     )
 
-    # Start voting loop
-    voting_task = vote_manager.start_voting_loop()
-    logger.info("Voting loop started")
-
-    # Initialize and run bot
+    # Initialize bot
     bot = TwitchPlaysBot(config=config, vote_manager=vote_manager)
 
+    # Run bot and voting loop together; the group owns both tasks, so a
+    # Ctrl+C or a crash in either one winds down the other
     try:
-        await bot.start()
-    except KeyboardInterrupt:
-        logger.info("\n👋 Shutting down gracefully...")
-    except Exception as e:
-        logger.error(f"Bot error: {e}", exc_info=True)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(vote_manager.run())
+            bot_task = tg.create_task(bot.start())
+            bot_task.add_done_callback(lambda _: vote_manager.request_stop())
+            logger.info("Voting loop started")
+    except* Exception as eg:
+        for error in eg.exceptions:
+            logger.error(f"Bot error: {error}", exc_info=error)
     finally:
-        # Clean up
-        await vote_manager.stop_voting_loop()
-        voting_task.cancel()
-        try:
-            await voting_task
-        except asyncio.CancelledError:
-            pass
         logger.info("Cleanup complete")
 
 
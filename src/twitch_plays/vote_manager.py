@@ -1,17 +1,23 @@
 """Vote management system for Twitch Plays bot."""
 import asyncio
-import time
-from collections import Counter, deque
-from collections.abc import Callable, Awaitable
-from typing import Optional
+import logging
+from collections.abc import Callable, Awaitable, Iterable
+
+logger = logging.getLogger(__name__)
 
 
 class VoteManager:
-    """Manages vote collection and aggregation over time windows."""
+    """
+    Manages vote collection and aggregation over time windows.
+
+    Votes are folded into fixed per-command counters as they arrive rather
+    than stored individually, so memory stays O(#commands) no matter how
+    busy the chat gets.
+    """
 
     def __init__(
         self,
-        commands: list[str],
+        commands: Iterable[str],
         window_seconds: float,
         min_votes_threshold: int,
         action_handler: Callable[[str], Awaitable[None]],
@@ -20,20 +26,33 @@ class VoteManager:
         Initialize the vote manager.
 
         Args:
-            commands: List of valid commands
+            commands: Valid commands
             window_seconds: Duration of voting window in seconds
             min_votes_threshold: Minimum votes required to trigger action
             action_handler: Async function to call with winning command
         """
-        self.commands = set(commands)
+        self.commands = frozenset(commands)
         self.window_seconds = window_seconds
         self.min_votes_threshold = min_votes_threshold
         self.action_handler = action_handler
 
-        # Store votes as (command, timestamp) tuples
-        self._votes: deque[tuple[str, float]] = deque()
-        self._voting_task: Optional[asyncio.Task] = None
-        self._running = False
+        # Per-command tallies, bumped in O(1) as votes arrive
+        self._counts: dict[str, int] = {cmd: 0 for cmd in commands}
+        # Sequence number of each command's first vote, for deterministic tie-breaking
+        self._first_seen: dict[str, int] = {}
+        self._seq = 0
+        self._voting_task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+        self._action_sem = asyncio.Semaphore(1)
+        # Keep references to in-flight action tasks so they aren't GC'd
+        self._action_tasks: set[asyncio.Task] = set()
+        # Set once the bot is connected; the voting loop waits on this so the
+        # first window doesn't tick away before any votes can arrive
+        self._ready = asyncio.Event()
+
+    def mark_ready(self) -> None:
+        """Signal that the bot is connected and voting windows may begin."""
+        self._ready.set()
 
     def record_vote(self, command: str) -> None:
         """
@@ -42,58 +61,137 @@ class VoteManager:
         Args:
             command: The command that was voted for
         """
-        if command not in self.commands:
+        # One dict probe validates the command and reads its count in C
+        counts = self._counts
+        count = counts.get(command)
+        if count is None:
             return
 
-        timestamp = time.time()
-        self._votes.append((command, timestamp))
+        counts[command] = count + 1
+        self._first_seen.setdefault(command, self._seq)
+        self._seq += 1
 
-    def get_winning_command(self) -> Optional[str]:
+    def get_winning_command(self) -> str | None:
         """
         Get the most popular command from current votes.
 
         Returns:
             The winning command, or None if below threshold
         """
-        self._clear_old_votes()
+        return self._tally(self._counts, self._first_seen)
 
-        if not self._votes:
-            return None
+    def _tally(self, counts: dict[str, int], first_seen: dict[str, int]) -> str | None:
+        """
+        Pick the winning command from a set of tallies.
 
-        # Count votes for each command
-        vote_counts = Counter(cmd for cmd, _ in self._votes)
+        Args:
+            counts: Per-command vote counts
+            first_seen: Sequence number of each command's first vote
 
-        # Check if we meet minimum threshold
-        total_votes = sum(vote_counts.values())
+        Returns:
+            The winning command, or None if below threshold
+        """
+        # Single pass over the handful of commands: track the total and the
+        # leader (earliest first vote wins ties) without building key tuples
+        total_votes = 0
+        winning_command = None
+        best_count = 0
+        best_seen = 0
+        for command, count in counts.items():
+            if not count:
+                continue
+            total_votes += count
+            seen = first_seen[command]
+            if count > best_count or (count == best_count and seen < best_seen):
+                winning_command = command
+                best_count = count
+                best_seen = seen
+
+        # Check if we meet minimum threshold (also covers the no-votes case)
         if total_votes < self.min_votes_threshold:
             return None
 
-        # Return command with most votes (first in case of tie)
-        winning_command, _ = vote_counts.most_common(1)[0]
         return winning_command
 
-    def _clear_old_votes(self) -> None:
-        """Remove votes older than the voting window."""
-        current_time = time.time()
-        cutoff_time = current_time - self.window_seconds
-
-        # Remove votes from the left (oldest) until we hit recent votes
-        while self._votes and self._votes[0][1] < cutoff_time:
-            self._votes.popleft()
-
     async def _voting_loop(self) -> None:
         """Main voting loop that periodically tallies votes and triggers actions."""
-        while self._running:
-            await asyncio.sleep(self.window_seconds)
+        # Wait until the bot is connected, unless a stop comes first
+        ready_wait = asyncio.create_task(self._ready.wait())
+        stop_wait = asyncio.create_task(self._stop.wait())
+        try:
+            await asyncio.wait((ready_wait, stop_wait), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready_wait.cancel()
+            stop_wait.cancel()
+        if self._stop.is_set():
+            return
+
+        # Anchor each window to a monotonic deadline so tallying time doesn't
+        # accumulate as drift in the window cadence
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window_seconds
+
+        while True:
+            # Sleep out the window, but wake immediately if a stop is requested
+            try:
+                await asyncio.wait_for(
+                    self._stop.wait(), timeout=max(0.0, deadline - loop.time())
+                )
+                break
+            except TimeoutError:
+                pass
+
+            deadline += self.window_seconds
 
-            # Clear old votes and get winner
-            winning_command = self.get_winning_command()
+            # Swap the tallies out in one step so any vote recorded from here on
+            # lands in the next window instead of being lost to a late clear
+            counts, self._counts = self._counts, dict.fromkeys(self._counts, 0)
+            first_seen, self._first_seen = self._first_seen, {}
+
+            winning_command = self._tally(counts, first_seen)
 
             if winning_command:
-                await self.action_handler(winning_command)
+                self._dispatch_action(winning_command)
+
+    def _dispatch_action(self, command: str) -> None:
+        """
+        Run the action handler in the background.
+
+        A slow handler (I/O, controller emulation) must not delay the next
+        voting window, so it runs as its own task; a semaphore keeps actions
+        executing one at a time, in order.
+
+        Args:
+            command: The winning command to execute
+        """
+        async def _run() -> None:
+            async with self._action_sem:
+                try:
+                    await self.action_handler(command)
+                except Exception:
+                    logger.exception("Action handler failed for %r", command)
+
+        task = asyncio.create_task(_run())
+        self._action_tasks.add(task)
+        task.add_done_callback(self._action_tasks.discard)
+
+    async def run(self) -> None:
+        """
+        Run the voting loop in the calling task until a stop is requested.
 
-            # Clear votes after processing
-            self._votes.clear()
+        This is the structured-concurrency entry point, meant to be handed
+        to an asyncio.TaskGroup alongside the bot. In-flight actions are
+        drained before it returns.
+        """
+        try:
+            await self._voting_loop()
+        finally:
+            if self._action_tasks:
+                await asyncio.gather(*self._action_tasks)
+
+    def request_stop(self) -> None:
+        """Ask the voting loop to exit; returns without waiting for it."""
+        self._stop.set()
 
     def start_voting_loop(self) -> asyncio.Task:
         """
@@ -105,16 +203,13 @@ class VoteManager:
         if self._voting_task and not self._voting_task.done():
             raise RuntimeError("Voting loop is already running")
 
-        self._running = True
-        self._voting_task = asyncio.create_task(self._voting_loop())
+        # Fresh stop event so the loop is restartable after a previous stop
+        self._stop = asyncio.Event()
+        self._voting_task = asyncio.create_task(self.run())
         return self._voting_task
 
     async def stop_voting_loop(self) -> None:
-        """Stop the voting loop."""
-        self._running = False
+        """Stop the voting loop started by start_voting_loop and wait for it."""
+        self.request_stop()
         if self._voting_task:
-            self._voting_task.cancel()
-            try:
-                await self._voting_task
-            except asyncio.CancelledError:
-                pass
+            await self._voting_task
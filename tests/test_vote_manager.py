@@ -1,6 +1,5 @@
 """Tests for the VoteManager class."""
 import asyncio
-import time
 from unittest.mock import AsyncMock
 
 import pytest
@@ -14,12 +13,23 @@ def mock_action_handler():
     return AsyncMock()
 
 
+WINDOW = 0.1  # Short voting window so loop tests finish in milliseconds
+
+
+async def wait_until(predicate, timeout=1.0):
+    """Poll until predicate() is true, failing the test on timeout."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition never became true"
+        await asyncio.sleep(0.005)
+
+
 @pytest.fixture
 def vote_manager(mock_action_handler):
     """Create a VoteManager instance for testing."""
     return VoteManager(
         commands=["forward", "back", "left", "right"],
-        window_seconds=1.0,  # Short window for fast tests
+        window_seconds=WINDOW,
         min_votes_threshold=1,
         action_handler=mock_action_handler,
     )
@@ -28,14 +38,14 @@ def vote_manager(mock_action_handler):
 def test_record_vote_valid_command(vote_manager):
     """Test recording a valid vote."""
     vote_manager.record_vote("forward")
-    assert len(vote_manager._votes) == 1
-    assert vote_manager._votes[0][0] == "forward"
+    assert vote_manager._counts["forward"] == 1
 
 
 def test_record_vote_invalid_command(vote_manager):
     """Test that invalid commands are ignored."""
     vote_manager.record_vote("invalid")
-    assert len(vote_manager._votes) == 0
+    assert sum(vote_manager._counts.values()) == 0
+    assert "invalid" not in vote_manager._counts
 
 
 def test_record_multiple_votes(vote_manager):
@@ -43,7 +53,20 @@ def test_record_multiple_votes(vote_manager):
     vote_manager.record_vote("forward")
     vote_manager.record_vote("back")
     vote_manager.record_vote("forward")
-    assert len(vote_manager._votes) == 3
+    assert vote_manager._counts["forward"] == 2
+    assert vote_manager._counts["back"] == 1
+
+
+def test_vote_flood_does_not_grow_state(vote_manager):
+    """Test that a vote spike only bumps counters instead of growing storage."""
+    for _ in range(10_000):
+        vote_manager.record_vote("forward")
+        vote_manager.record_vote("invalid")
+
+    # Tally state stays one entry per command no matter the vote volume
+    assert len(vote_manager._counts) == len(vote_manager.commands)
+    assert len(vote_manager._first_seen) == 1
+    assert vote_manager._counts["forward"] == 10_000
 
 
 def test_get_winning_command_single_vote(vote_manager):
@@ -65,13 +88,12 @@ def test_get_winning_command_multiple_votes(vote_manager):
 
 
 def test_get_winning_command_tie(vote_manager):
-    """Test that ties are broken by first occurrence."""
-    vote_manager.record_vote("forward")
+    """Test that ties are broken by first vote received."""
     vote_manager.record_vote("back")
+    vote_manager.record_vote("forward")
 
     winner = vote_manager.get_winning_command()
-    # Should return one of them (Counter.most_common is deterministic for equal counts)
-    assert winner in ["forward", "back"]
+    assert winner == "back"
 
 
 def test_get_winning_command_no_votes(vote_manager):
@@ -84,7 +106,7 @@ def test_get_winning_command_below_threshold(vote_manager, mock_action_handler):
     """Test that commands below threshold return None."""
     vm = VoteManager(
         commands=["forward", "back"],
-        window_seconds=1.0,
+        window_seconds=WINDOW,
         min_votes_threshold=3,
         action_handler=mock_action_handler,
     )
@@ -96,33 +118,13 @@ def test_get_winning_command_below_threshold(vote_manager, mock_action_handler):
     assert winner is None  # Only 2 votes, threshold is 3
 
 
-def test_clear_old_votes(vote_manager):
-    """Test that old votes are cleared."""
-    # Record a vote
+def test_tallies_persist_between_reads(vote_manager):
+    """Test that reading the winner does not consume the tallies."""
     vote_manager.record_vote("forward")
-    assert len(vote_manager._votes) == 1
 
-    # Wait for votes to become old (window is 1 second)
-    time.sleep(1.1)
-
-    # Clear old votes
-    vote_manager._clear_old_votes()
-
-    # Votes should be cleared
-    assert len(vote_manager._votes) == 0
-
-
-def test_clear_old_votes_keeps_recent(vote_manager):
-    """Test that recent votes are kept."""
-    vote_manager.record_vote("forward")
-    time.sleep(0.5)  # Wait half the window
-    vote_manager.record_vote("back")
-
-    # Clear old votes
-    vote_manager._clear_old_votes()
-
-    # Both votes should still be there (window is 1 second)
-    assert len(vote_manager._votes) == 2
+    assert vote_manager.get_winning_command() == "forward"
+    assert vote_manager.get_winning_command() == "forward"
+    assert vote_manager._counts["forward"] == 1
 
 
 @pytest.mark.asyncio
@@ -130,15 +132,15 @@ async def test_voting_loop_triggers_action(vote_manager, mock_action_handler):
     """Test that the voting loop triggers actions."""
     # Start voting loop first
     task = vote_manager.start_voting_loop()
+    vote_manager.mark_ready()
 
-    # Wait a bit, then record some votes during the voting window
-    await asyncio.sleep(0.1)
+    # Record some votes during the voting window
     vote_manager.record_vote("forward")
     vote_manager.record_vote("forward")
     vote_manager.record_vote("back")
 
-    # Wait for the voting cycle to complete (1 second window + buffer for processing)
-    await asyncio.sleep(1.5)
+    # Wait for a voting cycle to process the votes
+    await wait_until(lambda: mock_action_handler.call_count > 0)
 
     # Stop the loop
     await vote_manager.stop_voting_loop()
@@ -153,7 +155,7 @@ async def test_voting_loop_no_action_below_threshold(vote_manager, mock_action_h
     # Create manager with higher threshold
     vm = VoteManager(
         commands=["forward", "back"],
-        window_seconds=1.0,
+        window_seconds=WINDOW,
         min_votes_threshold=5,
         action_handler=mock_action_handler,
     )
@@ -164,9 +166,10 @@ async def test_voting_loop_no_action_below_threshold(vote_manager, mock_action_h
 
     # Start voting loop
     task = vm.start_voting_loop()
+    vm.mark_ready()
 
-    # Wait for one voting cycle
-    await asyncio.sleep(1.5)
+    # Wait for at least one full voting cycle
+    await wait_until(lambda: sum(vm._counts.values()) == 0)
 
     # Stop the loop
     await vm.stop_voting_loop()
@@ -196,6 +199,39 @@ async def test_stop_voting_loop(vote_manager):
     assert task.done()
 
 
+@pytest.mark.asyncio
+async def test_restart_after_stop(vote_manager, mock_action_handler):
+    """Test that the loop can be started again after a stop and still tallies."""
+    vote_manager.start_voting_loop()
+    vote_manager.mark_ready()
+    await vote_manager.stop_voting_loop()
+
+    task = vote_manager.start_voting_loop()
+    assert not task.done()
+
+    vote_manager.record_vote("forward")
+    await wait_until(lambda: mock_action_handler.call_count > 0)
+
+    await vote_manager.stop_voting_loop()
+    mock_action_handler.assert_called_once_with("forward")
+
+
+@pytest.mark.asyncio
+async def test_stop_voting_loop_is_prompt(mock_action_handler):
+    """Test that stopping does not wait out the remainder of the window."""
+    vm = VoteManager(
+        commands=["forward", "back"],
+        window_seconds=10.0,  # Long window to make a lazy shutdown obvious
+        min_votes_threshold=1,
+        action_handler=mock_action_handler,
+    )
+    vm.start_voting_loop()
+    vm.mark_ready()
+    await asyncio.sleep(0.05)  # Mid-window
+
+    await asyncio.wait_for(vm.stop_voting_loop(), timeout=0.5)
+
+
 @pytest.mark.asyncio
 async def test_votes_cleared_after_processing(vote_manager, mock_action_handler):
     """Test that votes are cleared after each voting cycle."""
@@ -205,11 +241,23 @@ async def test_votes_cleared_after_processing(vote_manager, mock_action_handler)
 
     # Start voting loop
     task = vote_manager.start_voting_loop()
+    vote_manager.mark_ready()
+
+    # Votes should be cleared once the cycle completes
+    await wait_until(lambda: sum(vote_manager._counts.values()) == 0)
+
+    await vote_manager.stop_voting_loop()
 
-    # Wait for one voting cycle
-    await asyncio.sleep(1.5)
 
-    # Votes should be cleared
-    assert len(vote_manager._votes) == 0
+@pytest.mark.asyncio
+async def test_voting_loop_waits_for_ready(vote_manager, mock_action_handler):
+    """Test that no voting window runs before mark_ready is called."""
+    vote_manager.record_vote("forward")
+    task = vote_manager.start_voting_loop()
+
+    # Several full windows pass, but the loop is still waiting on the ready signal
+    await asyncio.sleep(WINDOW * 3)
+    mock_action_handler.assert_not_called()
+    assert vote_manager._counts["forward"] == 1
 
     await vote_manager.stop_voting_loop()